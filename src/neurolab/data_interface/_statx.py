@@ -0,0 +1,108 @@
+"""
+Linux statx(2) fast path for the filesystem collector.
+
+The collector only needs a file's size and mtime. statx lets us ask for just those
+fields and pass AT_STATX_DONT_SYNC so network/FUSE filesystems may answer from
+cached attributes instead of round-tripping to the server. On other platforms, or
+when libc/the kernel lacks statx, fast_stat() returns None and callers fall back
+to os.stat().
+"""
+
+from __future__ import annotations
+
+import ctypes
+import errno
+import os
+import sys
+
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+
+_STATX_TYPE = 0x0001
+_STATX_MTIME = 0x0040
+_STATX_SIZE = 0x0200
+_STATX_BASIC_STATS = 0x07FF
+_WANTED = _STATX_TYPE | _STATX_SIZE | _STATX_MTIME
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    """Mirror of the kernel's struct statx (256 bytes); only a few fields are read."""
+
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("_tail", ctypes.c_uint8 * 128),
+    ]
+
+
+# None = not probed yet; set once on first use.
+_STATX_AVAILABLE: bool | None = None
+_statx_fn = None
+
+
+def _probe() -> bool:
+    """Load libc's statx and check the kernel supports it; caches the result."""
+    global _STATX_AVAILABLE, _statx_fn
+    if _STATX_AVAILABLE is not None:
+        return _STATX_AVAILABLE
+
+    _STATX_AVAILABLE = False
+    if sys.platform != "linux":
+        return False
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fn = libc.statx
+    except (OSError, AttributeError):
+        return False  # glibc < 2.28 or non-glibc libc without a wrapper
+
+    fn.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.POINTER(_Statx)]
+    fn.restype = ctypes.c_int
+
+    buf = _Statx()
+    if fn(_AT_FDCWD, b".", 0, _STATX_BASIC_STATS, ctypes.byref(buf)) != 0:
+        # ENOSYS on old kernels, EPERM under some seccomp sandboxes
+        if ctypes.get_errno() in (errno.ENOSYS, errno.EPERM):
+            return False
+
+    _statx_fn = fn
+    _STATX_AVAILABLE = True
+    return True
+
+
+def fast_stat(path: str) -> tuple[int, float] | None:
+    """Return (size_bytes, mtime_epoch) for path via statx, or None to signal fallback.
+
+    Symlinks are followed, matching os.stat(). Any failure returns None so the caller's
+    regular stat path surfaces the real error.
+    """
+    if not _probe():
+        return None
+
+    buf = _Statx()
+    if _statx_fn(_AT_FDCWD, os.fsencode(path), _AT_STATX_DONT_SYNC, _WANTED, ctypes.byref(buf)) != 0:
+        return None
+    if buf.stx_mask & (_STATX_SIZE | _STATX_MTIME) != (_STATX_SIZE | _STATX_MTIME):
+        return None
+    return buf.stx_size, buf.stx_mtime.tv_sec + buf.stx_mtime.tv_nsec * 1e-9
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import re
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Protocol
-from uuid import uuid4
+from uuid import UUID
 
+from ._statx import fast_stat
 from .hashing import hash_file_sha256, hash_manifest_id
 from .models import Artifact, DataSourceSpec, Manifest, utc_now
 
@@ -13,7 +19,7 @@ from .models import Artifact, DataSourceSpec, Manifest, utc_now
 class ArtifactCollector(Protocol):
     """Protocol for artifact collectors."""
 
-    def collect(self, source: DataSourceSpec) -> Manifest: ...
+    def collect(self, source: DataSourceSpec, prior: Manifest | None = None) -> Manifest: ...
 
 
 # Extension -> MIME type mapping for basic inference; not meant to be comprehensive.
@@ -39,27 +45,199 @@ _MEDIA_BY_EXT: dict[str, str] = {
 }
 
 
-def _infer_media_type(path: Path) -> str | None:
-    """Return the MIME type for a file extension, or None if unknown."""
-    return _MEDIA_BY_EXT.get(path.suffix.lower())
+# hashlib releases the GIL while hashing, so threads overlap disk reads and digest work.
+_HASH_MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
 
 
-def _any_pattern_matches(path: Path, patterns: list[str]) -> bool:
-    return any(path.match(pat) for pat in patterns)
+# Warnings kept per manifest; beyond this they are only counted (e.g. a tree full of
+# permission errors should not produce one formatted message per file).
+_MAX_WARNINGS = 1024
 
+# Directory scans in flight for hints["parallel_walk"]; these wait on I/O, not CPU.
+_WALK_WORKERS = 8
+
+
+def _infer_media_type(name: str) -> str | None:
+    """Return the MIME type for a file name's extension, or None if unknown.
+
+    Takes the bare name (e.g. DirEntry.name) so the walk need not build a Path per file;
+    a leading dot, as in '.bashrc', does not start an extension.
+    """
+    dot = name.rfind(".")
+    return _MEDIA_BY_EXT.get(name[dot:].lower()) if dot > 0 else None
 
-def _matches_any(path: Path, patterns: list[str] | None) -> bool:
-    """Return True if path matches ANY pattern; if patterns is None/empty, True."""
-    if not patterns:
-        return True
-    return _any_pattern_matches(path, patterns)
 
+def _size_and_mtime(path: str, entry: os.DirEntry[str] | None = None, use_statx: bool = False) -> tuple[int, float]:
+    """Return (size_bytes, mtime_epoch) for path; with use_statx, try Linux statx first.
+
+    statx goes through ctypes and costs more per call than os.stat on a local disk, so
+    it only pays off where AT_STATX_DONT_SYNC saves a network round trip.
+    """
+    if use_statx:
+        fast = fast_stat(path)
+        if fast is not None:
+            return fast
+    st = entry.stat() if entry is not None else os.stat(path)
+    return st.st_size, st.st_mtime
+
+
+def _glob_component_to_regex(component: str) -> str:
+    """Translate one path component of a glob; wildcards never match '/'."""
+    out: list[str] = []
+    i, n = 0, len(component)
+    while i < n:
+        c = component[i]
+        i += 1
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and component[j] in "!^":
+                j += 1
+            if j < n and component[j] == "]":
+                j += 1
+            while j < n and component[j] != "]":
+                j += 1
+            if j >= n:
+                out.append(re.escape(c))  # unterminated class is a literal '['
+                continue
+            body = component[i:j].replace("\\", "\\\\")
+            if body[0] in "!^":
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = j + 1
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
 
-def _excluded(path: Path, patterns: list[str] | None) -> bool:
-    """Return True if path matches ANY exclude pattern; if patterns is None/empty, False."""
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a glob to a regex over '/'-separated paths, matched from the right.
+
+    A relative pattern matches the trailing components of the path it is given (the
+    collector passes the root-relative path), an absolute pattern must match the whole
+    path, and a '**' component matches zero or more directories. '.' components are
+    ignored.
+    """
+    anchored = pattern.startswith("/")
+    parts = [part for part in pattern.strip("/").split("/") if part and part != "."]
+    regex = ""
+    for k, part in enumerate(parts):
+        if part == "**":
+            regex += "(?:[^/]+/)*" if k < len(parts) - 1 else ".*"
+        else:
+            regex += _glob_component_to_regex(part) + ("/" if k < len(parts) - 1 else "")
+    return ("/" if anchored else "(?:.*/)?") + regex
+
+
+@lru_cache(maxsize=256)
+def _compile_globs(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile glob patterns into one alternation regex; None if there are no patterns.
+
+    Cached across collect() calls, so callers pass a tuple (lists are unhashable).
+
+    A single compiled alternation is what pathspec/globset would give us as well, so the
+    filter costs one regex match per path without adding a dependency, and patterns keep
+    the right-anchored matching of _glob_to_regex rather than switching to gitignore rules.
+    """
     if not patterns:
-        return False
-    return _any_pattern_matches(path, patterns)
+        return None
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    alternation = "|".join(f"(?:{_glob_to_regex(p)})" for p in patterns)
+    return re.compile(rf"(?:{alternation})\Z", flags)
+
+
+def _no_match(path: str) -> None:
+    return None
+
+
+@lru_cache(maxsize=256)
+def _path_matcher(patterns: tuple[str, ...]) -> Callable[[str, str], bool] | None:
+    """Return a matcher(rel_posix, abs_posix) for glob patterns; None if there are no patterns.
+
+    Relative patterns are matched against the path relative to the source root, so the
+    root's own parent directories can never satisfy them; absolute patterns ('/...')
+    are matched against the absolute path.
+    """
+    rel_re = _compile_globs(tuple(p for p in patterns if not p.startswith("/")))
+    abs_re = _compile_globs(tuple(p for p in patterns if p.startswith("/")))
+    if rel_re is None and abs_re is None:
+        return None
+    rel_match = rel_re.match if rel_re is not None else _no_match
+    abs_match = abs_re.match if abs_re is not None else _no_match
+
+    def matches(rel_posix: str, abs_posix: str) -> bool:
+        return rel_match(rel_posix) is not None or abs_match(abs_posix) is not None
+
+    return matches
+
+
+def _directory_excludes(patterns: list[str] | None) -> tuple[str, ...]:
+    """Return the exclude patterns that name whole directories, rewritten to match the directory.
+
+    'build/**' and 'cache/' prune the named directory, as do patterns whose last
+    component is a plain name such as 'node_modules' or '**/__pycache__'. Wildcard
+    names like '*.log' only ever exclude files.
+    """
+    dir_patterns: list[str] = []
+    for pattern in patterns or []:
+        if pattern.endswith("/**"):
+            dir_patterns.append(pattern[:-3])
+        elif pattern.endswith("/"):
+            dir_patterns.append(pattern.rstrip("/"))
+        elif not any(c in pattern.rsplit("/", 1)[-1] for c in "*?["):
+            dir_patterns.append(pattern)
+    return tuple(p for p in dir_patterns if p.strip("/"))
+
+
+def _split_literal_prefix(pattern: str) -> tuple[str, str]:
+    """Split a glob into its leading wildcard-free directories and the rest.
+
+    e.g. "data/2024/**/*.parquet" -> ("data/2024", "**/*.parquet"). The last component
+    always stays in the tail since it names files, not a directory to walk.
+    """
+    parts = pattern.split("/")
+    k = 0
+    while k < len(parts) - 1 and not any(c in parts[k] for c in "*?["):
+        k += 1
+    return "/".join(parts[:k]), "/".join(parts[k:])
+
+
+def _walk_start(root: str, include_globs: list[str] | None) -> str:
+    """Return the deepest directory under root that can contain every included file.
+
+    Relative patterns match the trailing components of a root-relative path, so they can
+    match at any depth; only a set of absolute include patterns narrows the walk,
+    otherwise the walk starts at root.
+    """
+    if not include_globs or not all(p.startswith("/") for p in include_globs):
+        return root
+    prefixes = [_split_literal_prefix(p)[0] or "/" for p in include_globs]
+    common = os.path.commonpath(prefixes)
+    posix_root = _posix(root)
+    if common.startswith(posix_root.rstrip("/") + "/"):
+        return os.path.normpath(common)
+    return root
+
+
+def _posix(path: str) -> str:
+    return path.replace(os.sep, "/") if os.sep != "/" else path
+
+
+@dataclass(slots=True)
+class _DirListing:
+    """Files (as columns) and subdirectories found by scanning a single directory."""
+
+    abs_paths: list[str] = field(default_factory=list)
+    rel_paths: list[str | None] = field(default_factory=list)
+    sizes: list[int] = field(default_factory=list)
+    mtimes: list[float] = field(default_factory=list)
+    media_types: list[str | None] = field(default_factory=list)
+    subdirs: list[tuple[str, str]] = field(default_factory=list)
+    # (format, args) pairs; formatted only if they fit under the collector's warning cap
+    warnings: list[tuple[str, tuple[object, ...]]] = field(default_factory=list)
 
 
 @dataclass
@@ -69,92 +247,249 @@ class FilesystemCollector:
     Supports single-file and directory sources with optional recursive traversal
     and include/exclude glob patterns. Gathers metadata (size, mtime, content hash,
     media type) for each discovered file.
+
+    Relative include/exclude patterns match the path relative to the source root (the
+    full path for a single-file source); absolute patterns match the absolute path.
+
+    If a prior manifest is given, files whose absolute path, size and mtime are
+    unchanged reuse its content hash instead of being read again.
+
+    Absolute paths are the walked paths as-is; set hints["follow_symlinks"] = True to
+    record them with symlinks resolved.
+
+    Setting hints["parallel_walk"] = True on the source lists directories from a small
+    thread pool. This helps on network filesystems (NFS, SMB, FUSE) where each listing
+    is a round trip; on local disks it is usually no faster and can be slower.
+
+    Setting hints["statx"] = True reads size and mtime via Linux statx with
+    AT_STATX_DONT_SYNC, letting network/FUSE filesystems answer from cached attributes.
+    It is slower than os.stat on local disks, so it is off by default.
     """
 
-    def collect(self, source: DataSourceSpec) -> Manifest:
+    def collect(self, source: DataSourceSpec, prior: Manifest | None = None) -> Manifest:
         if source.source_type != "filesystem":
             raise ValueError(f"FilesystemCollector cannot handle source_type={source.source_type}")
 
-        root = Path(source.uri).expanduser()
+        # Paths are built with string ops from root; realpath() is only needed when the
+        # caller wants symlinks resolved, and then only for root and the symlinks themselves.
+        follow_symlinks = bool(source.hints.get("follow_symlinks"))
+        use_statx = bool(source.hints.get("statx"))
+        root = os.path.abspath(os.path.expanduser(source.uri))
+        if follow_symlinks:
+            root = os.path.realpath(root)
         warnings: list[str] = []
-        artifacts: list[Artifact] = []
+        warnings_dropped = 0
+
+        def warn(fmt: str, *args: object) -> None:
+            """Record a warning, formatting it only while under the cap."""
+            nonlocal warnings_dropped
+            if len(warnings) < _MAX_WARNINGS:
+                warnings.append(fmt % args)
+            else:
+                warnings_dropped += 1
+
+        # Discovered files are accumulated column-wise and turned into Artifacts in
+        # one pass at the end; relative_path is None for single-file sources.
+        abs_paths: list[str] = []
+        rel_paths: list[str | None] = []
+        sizes: list[int] = []
+        mtimes: list[float] = []
+        media_types: list[str | None] = []
+
+        # Globs are matched against the root-relative POSIX path (absolute patterns against
+        # the absolute path); compiled matchers are cached across collect() calls
+        include_match = _path_matcher(tuple(source.include_globs or ()))
+        exclude_match = _path_matcher(tuple(source.exclude_globs or ()))
+        # Directories matching these are skipped without being listed
+        prune_match = _path_matcher(_directory_excludes(source.exclude_globs))
+        needs_posix = os.sep != "/"
+        join = os.path.join
 
-        def try_add_file(p: Path, base_root: Path | None) -> None:
-            # Apply include/exclude rules
-            if _excluded(p, source.exclude_globs):
-                return
-            if not _matches_any(p, source.include_globs):
-                return
+        def scan_dir(dirpath: str, rel: str) -> _DirListing:
+            """List one directory: its wanted files and the subdirectories to descend into.
 
+            Uses os.scandir so the file type comes from the directory listing and each
+            file costs a single stat (statx with hints["statx"]). Symlinked directories
+            are not descended into. This is the per-file hot loop, so glob matching is
+            inlined and media types come from the bare entry name. Safe to run from
+            worker threads: it only touches the listing it returns.
+            """
+            listing = _DirListing()
             try:
-                st = p.stat()
-                size_bytes = st.st_size
-                mtime = datetime.fromtimestamp(st.st_mtime, tz=UTC)
-            except Exception as e:
-                warnings.append(f"stat failed for {p}: {e}")
-                return
-
-            content_hash: str | None = None
-            if source.compute_hash:
-                try:
-                    content_hash = hash_file_sha256(p)
-                except Exception as e:
-                    warnings.append(f"hash failed for {p}: {e}")
+                with os.scandir(dirpath) as it:
+                    for entry in it:
+                        name = entry.name
+                        path = entry.path
+                        rel_child = join(rel, name) if rel else name
+                        if needs_posix:
+                            rel_posix, abs_posix = rel_child.replace(os.sep, "/"), path.replace(os.sep, "/")
+                        else:
+                            rel_posix, abs_posix = rel_child, path
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if source.recursive and (prune_match is None or not prune_match(rel_posix, abs_posix)):
+                                    listing.subdirs.append((path, rel_child))
+                                continue
+                            # skip sockets/fifos etc; only collect regular files
+                            if not entry.is_file():
+                                continue
+                            if exclude_match is not None and exclude_match(rel_posix, abs_posix):
+                                continue
+                            if include_match is not None and not include_match(rel_posix, abs_posix):
+                                continue
+                            size_bytes, mtime = _size_and_mtime(path, entry, use_statx)
+                        except OSError as e:
+                            listing.warnings.append(("stat failed for %s: %s", (path, e)))
+                            continue
+                        listing.abs_paths.append(os.path.realpath(path) if follow_symlinks and entry.is_symlink() else path)
+                        listing.rel_paths.append(rel_child)
+                        listing.sizes.append(size_bytes)
+                        listing.mtimes.append(mtime)
+                        listing.media_types.append(_infer_media_type(name))
+            except OSError as e:
+                listing.warnings.append(("failed to list directory %s: %s", (dirpath, e)))
+            return listing
 
-            rel_path: str | None
-            abs_path = str(p.resolve())
-            if base_root is not None:
-                try:
-                    rel_path = str(p.resolve().relative_to(base_root.resolve()))
-                except Exception:
-                    # Fallback (should be rare)
-                    rel_path = str(p.name)
-            else:
-                rel_path = None  # single-file sources don't need a relative path
-
-            artifacts.append(
-                Artifact(
-                    artifact_id=str(uuid4()),
-                    source_uri=source.uri,
-                    artifact_type="file",
-                    relative_path=rel_path,
-                    absolute_path=abs_path,
-                    size_bytes=size_bytes,
-                    mtime=mtime,
-                    content_hash=content_hash,
-                    media_type=_infer_media_type(p),
-                    tags={},
-                )
-            )
+        def add_listing(listing: _DirListing) -> None:
+            abs_paths.extend(listing.abs_paths)
+            rel_paths.extend(listing.rel_paths)
+            sizes.extend(listing.sizes)
+            mtimes.extend(listing.mtimes)
+            media_types.extend(listing.media_types)
+            for fmt, args in listing.warnings:
+                warn(fmt, *args)
+
+        def walk(start: str, start_rel: str) -> None:
+            """Scan start and its subdirectories one at a time, depth-first."""
+            stack = [(start, start_rel)]
+            while stack:
+                listing = scan_dir(*stack.pop())
+                add_listing(listing)
+                stack.extend(listing.subdirs)
+
+        def walk_parallel(start: str, start_rel: str) -> None:
+            """Scan directories concurrently so slow (network) listings overlap.
+
+            Results are merged on this thread as each directory finishes; the walk is
+            done when no scans are in flight.
+            """
+            with ThreadPoolExecutor(max_workers=_WALK_WORKERS) as pool:
+                pending = {pool.submit(scan_dir, start, start_rel)}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        listing = future.result()
+                        add_listing(listing)
+                        pending.update(pool.submit(scan_dir, path, rel) for path, rel in listing.subdirs)
+
+        def start_reachable(start: str) -> bool:
+            """Return False if a narrowed walk start is missing or inside an excluded directory."""
+            if not os.path.isdir(start):
+                return False
+            while start != root:
+                if prune_match is not None and prune_match(_posix(os.path.relpath(start, root)), _posix(start)):
+                    return False
+                start = os.path.dirname(start)
+            return True
+
+        def hash_files(hashes: list[str | None], indices: list[int]) -> None:
+            """Hash the files at indices in parallel, in place; failures become warnings and None."""
+            with ThreadPoolExecutor(max_workers=min(_HASH_MAX_WORKERS, len(indices))) as pool:
+                futures = [pool.submit(hash_file_sha256, Path(abs_paths[i])) for i in indices]
+                # Consume in submission order so warnings are deterministic
+                for i, future in zip(indices, futures, strict=True):
+                    try:
+                        hashes[i] = future.result()
+                    except Exception as e:
+                        warn("hash failed for %s: %s", abs_paths[i], e)
 
         # Case 1: source points to a file
-        if root.is_file():
-            try_add_file(root, base_root=None)
+        if os.path.isfile(root):
+            # No root directory whose parents could leak in, so relative patterns see the full path too
+            match_path = _posix(root)
+            if (exclude_match is None or not exclude_match(match_path, match_path)) and (
+                include_match is None or include_match(match_path, match_path)
+            ):
+                try:
+                    size_bytes, mtime = _size_and_mtime(root, use_statx=use_statx)
+                except OSError as e:
+                    warn("stat failed for %s: %s", root, e)
+                else:
+                    abs_paths.append(root)
+                    rel_paths.append(None)
+                    sizes.append(size_bytes)
+                    mtimes.append(mtime)
+                    media_types.append(_infer_media_type(os.path.basename(root)))
 
         # Case 2: source points to a directory
-        elif root.is_dir():
-            # Walk files
-            try:
-                if source.recursive:
-                    iterator = root.rglob("*")
+        elif os.path.isdir(root):
+            # Absolute include patterns with a common literal prefix let us skip the rest of the tree
+            start = _walk_start(root, source.include_globs) if source.recursive else root
+            if start == root or start_reachable(start):
+                start_rel = os.path.relpath(start, root) if start != root else ""
+                if source.hints.get("parallel_walk"):
+                    walk_parallel(start, start_rel)
                 else:
-                    iterator = root.glob("*")
-            except Exception as e:
-                warnings.append(f"failed to list directory {root}: {e}")
-                iterator = []
-
-            for p in iterator:
-                # skip directories/symlinks-to-dirs etc; only collect regular files
-                try:
-                    if p.is_file():
-                        try_add_file(p, base_root=root)
-                except Exception as e:
-                    warnings.append(f"failed to inspect path {p}: {e}")
+                    walk(start, start_rel)
 
         else:
-            warnings.append(f"source uri does not exist or is not accessible: {root}")
+            warn("source uri does not exist or is not accessible: %s", root)
+
+        n = len(abs_paths)
+        mtime_dts = [datetime.fromtimestamp(mtime, tz=UTC) for mtime in mtimes]
+
+        hashes: list[str | None] = [None] * n
+        if source.compute_hash and n:
+            to_hash = list(range(n))
+            if prior is not None:
+                # Unchanged files (same path, size and mtime) keep their previous hash
+                prior_index = {
+                    a.absolute_path: (a.size_bytes, a.mtime, a.content_hash)
+                    for a in prior.artifacts
+                    if a.absolute_path is not None and a.content_hash is not None
+                }
+                to_hash = []
+                for i in range(n):
+                    previous = prior_index.get(abs_paths[i])
+                    if previous is not None and previous[0] == sizes[i] and previous[1] == mtime_dts[i]:
+                        hashes[i] = previous[2]
+                    else:
+                        to_hash.append(i)
+            if to_hash:
+                hash_files(hashes, to_hash)
+
+        # Bulk-convert the columns: one urandom call for all artifact IDs instead of
+        # one per uuid4().
+        id_bytes = os.urandom(16 * n)
+        artifact_ids = [str(UUID(bytes=id_bytes[16 * i : 16 * i + 16], version=4)) for i in range(n)]
+
+        # Sort by relative path once over the key column rather than via a per-Artifact lambda
+        sort_keys = [rel_path or "" for rel_path in rel_paths]
+        order = sorted(range(n), key=sort_keys.__getitem__)
+
+        # Values are trusted here, so skip the generated __init__ (order = Artifact field order)
+        construct = Artifact._unsafe_construct
+        source_uri = source.uri
+        artifacts = [
+            construct(
+                (
+                    source_uri,
+                    "file",
+                    rel_paths[i],
+                    abs_paths[i],
+                    sizes[i],
+                    mtime_dts[i],
+                    hashes[i],
+                    media_types[i],
+                    artifact_ids[i],
+                    {},
+                )
+            )
+            for i in order
+        ]
 
-        artifacts.sort(key=lambda a: a.relative_path or "")
+        if warnings_dropped:
+            warnings.append(f"... and {warnings_dropped} more warnings suppressed")
 
         return Manifest(
             manifest_id=hash_manifest_id(artifacts),
@@ -12,13 +12,19 @@ if TYPE_CHECKING:
 def hash_file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
     """
     Compute the SHA-256 hash of a file's contents.
-    Reads the file in chunks (default 1 MiB) to support large files without loading
-    the entire file into memory. Returns the hex digest.
+    Reads the file in chunks (default 1 MiB) into one reused buffer, so large files are
+    neither loaded whole nor copied into a new bytes object per chunk. A file that shrinks
+    while being read simply ends early. Returns the hex digest.
+
+    hashlib delegates to OpenSSL, which uses SHA-NI/ARMv8 SHA instructions when the CPU
+    has them, so the remaining cost is mostly memory bandwidth.
     """
     h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            h.update(chunk)
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    with path.open("rb", buffering=0) as f:
+        while n := f.readinto(buf):
+            h.update(view[:n])
     return h.hexdigest()
 
 
@@ -10,17 +10,23 @@ RULES:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import json
+from dataclasses import dataclass, field, fields
 from datetime import UTC, datetime
 from typing import Any, Literal
 from uuid import uuid4
 
+try:
+    import orjson
+except ImportError:  # optional: pip install neurolab[fast]
+    orjson = None
+
 
 def utc_now() -> datetime:
     return datetime.now(UTC)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataSourceSpec:
     """Defines the parameters for discovering artifacts from a data source.
 
@@ -29,6 +35,8 @@ class DataSourceSpec:
         source_type: The type of data source (currently only "filesystem" is supported).
         include_globs: Optional list of glob patterns to include (e.g., ["*.csv"]).
         exclude_globs: Optional list of glob patterns to exclude (e.g., ["*.tmp"]).
+            Patterns naming a directory ("cache/", "build/**", "**/__pycache__")
+            skip that directory's whole subtree.
         compute_hash: Whether to compute content hash for each artifact (default: True).
         recursive: Whether to search directories recursively (default: True).
         hints: Optional dictionary for additional discovery hints.
@@ -77,7 +85,7 @@ class DataSourceSpec:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Artifact:
     """Represents a discovered artifact from a data source.
 
@@ -111,6 +119,18 @@ class Artifact:
     artifact_id: str = field(default_factory=lambda: str(uuid4()))
     tags: dict[str, str] = field(default_factory=dict)
 
+    @classmethod
+    def _unsafe_construct(cls, values: tuple[Any, ...]) -> Artifact:
+        """Build an Artifact from values in field declaration order, skipping __init__.
+
+        For trusted producers (e.g. the filesystem collector) that create many artifacts;
+        slot descriptors are assigned directly. No defaults are applied and nothing is validated.
+        """
+        obj = object.__new__(cls)
+        for set_slot, value in zip(_ARTIFACT_SLOT_SETTERS, values, strict=True):
+            set_slot(obj, value)
+        return obj
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize to a dictionary."""
         return {
@@ -131,37 +151,41 @@ class Artifact:
         """Validate input and construct an Artifact instance."""
         if not isinstance(d, dict):
             raise TypeError("Input must be a dictionary")
-        if "artifact_id" not in d:
-            raise ValueError("Missing required field: artifact_id")
-        if "source_uri" not in d:
-            raise ValueError("Missing required field: source_uri")
-        if "artifact_type" not in d:
-            raise ValueError("Missing required field: artifact_type")
-
-        artifact_type = d["artifact_type"]
+        try:
+            artifact_id = d["artifact_id"]
+            source_uri = d["source_uri"]
+            artifact_type = d["artifact_type"]
+        except KeyError as e:
+            raise ValueError(f"Missing required field: {e.args[0]}") from None
+
         if artifact_type not in ("file", "db_table"):
             raise ValueError(f"Invalid artifact_type: {artifact_type}")
 
-        mtime_iso = d.get("mtime")
+        get = d.get
+        mtime_iso = get("mtime")
         mtime = datetime.fromisoformat(mtime_iso) if mtime_iso else None
         if mtime and mtime.tzinfo is None:
             raise ValueError("mtime must be timezone-aware")
 
         return cls(
-            artifact_id=d["artifact_id"],
-            source_uri=d["source_uri"],
+            source_uri=source_uri,
             artifact_type=artifact_type,
-            relative_path=d.get("relative_path"),
-            absolute_path=d.get("absolute_path"),
-            size_bytes=d.get("size_bytes"),
+            relative_path=get("relative_path"),
+            absolute_path=get("absolute_path"),
+            size_bytes=get("size_bytes"),
             mtime=mtime,
-            content_hash=d.get("content_hash"),
-            media_type=d.get("media_type"),
-            tags=dict(d.get("tags", {})),
+            content_hash=get("content_hash"),
+            media_type=get("media_type"),
+            artifact_id=artifact_id,
+            tags=dict(get("tags", {})),
         )
 
 
-@dataclass(frozen=True)
+# Slot descriptor setters in field order, used by Artifact._unsafe_construct
+_ARTIFACT_SLOT_SETTERS = tuple(getattr(Artifact, f.name).__set__ for f in fields(Artifact))
+
+
+@dataclass(frozen=True, slots=True)
 class Manifest:
     """Represents the result of an artifact discovery process.
 
@@ -181,8 +205,14 @@ class Manifest:
 
     @property
     def artifact_count(self) -> int:
+        """Number of artifacts; O(1), so callers that only report counts need not touch the list."""
         return len(self.artifacts)
 
+    @property
+    def warning_count(self) -> int:
+        """Number of warnings; O(1)."""
+        return len(self.warnings)
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize to a dictionary."""
         return {
@@ -193,6 +223,22 @@ class Manifest:
             "warnings": self.warnings,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact JSON bytes with the same shape as to_dict().
+
+        Uses orjson when installed (it encodes the dataclasses directly, without building
+        intermediate dicts); otherwise falls back to the stdlib json module.
+        """
+        if orjson is not None:
+            return orjson.dumps(self)
+        return json.dumps(self.to_dict()).encode("utf-8")
+
+    @classmethod
+    def from_json_bytes(cls, data: bytes) -> Manifest:
+        """Parse JSON bytes (as written by to_json_bytes()) and construct a Manifest; uses orjson when installed."""
+        d = orjson.loads(data) if orjson is not None else json.loads(data)
+        return cls.from_dict(d)
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> Manifest:
         """Validate input and construct a Manifest instance."""
@@ -211,7 +257,8 @@ class Manifest:
         created_at = datetime.fromisoformat(d["created_at"])
         if created_at and created_at.tzinfo is None:
             raise ValueError("created_at must be timezone-aware")
-        artifacts = [Artifact.from_dict(artifact) for artifact in d["artifacts"]]
+        artifact_from_dict = Artifact.from_dict
+        artifacts = [artifact_from_dict(artifact) for artifact in d["artifacts"]]
 
         return cls(
             manifest_id=d["manifest_id"],
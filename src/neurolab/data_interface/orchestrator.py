@@ -1,13 +1,24 @@
 from __future__ import annotations
 
-from .collectors import FilesystemCollector
+from collections.abc import Callable
+
+from .collectors import ArtifactCollector, FilesystemCollector
 from .models import DataSourceSpec, Manifest
 
+# source_type -> collector factory; add an entry here to support a new source type.
+_COLLECTORS: dict[str, Callable[[], ArtifactCollector]] = {
+    "filesystem": FilesystemCollector,
+}
+
 
-def collect_source(source: DataSourceSpec) -> Manifest:
-    """Select the appropriate collector and return a Manifest for the given source."""
-    if source.source_type == "filesystem":
-        collector = FilesystemCollector()
-        return collector.collect(source)
+def collect_source(source: DataSourceSpec, prior: Manifest | None = None) -> Manifest:
+    """Select the appropriate collector and return a Manifest for the given source.
 
-    raise ValueError(f"No collector registered for source_type={source.source_type}")
+    prior, if given, is an earlier manifest of the same source whose content hashes
+    may be reused for unchanged artifacts.
+    """
+    try:
+        make_collector = _COLLECTORS[source.source_type]
+    except KeyError:
+        raise ValueError(f"No collector registered for source_type={source.source_type}") from None
+    return make_collector().collect(source, prior=prior)
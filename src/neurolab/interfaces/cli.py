@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import copy
+import functools
+import json
+import sys
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
 import typer
-from rich import print
-from rich.table import Table
 
-from neurolab.data_interface.models import DataSourceSpec
-from neurolab.data_interface.orchestrator import collect_source
-from neurolab.storage.manifest_store import FileManifestStore
 from neurolab.storage.roster_store import RosterStore
 
+if TYPE_CHECKING:
+    from neurolab.storage.manifest_store import FileManifestStore
+
 app = typer.Typer(no_args_is_help=True)
 roster_app = typer.Typer(help="Manage a short list of manifest aliases (e.g. r1, r2) for quick reference.")
 app.add_typer(roster_app, name="roster")
@@ -20,6 +25,81 @@ def main():
     pass
 
 
+def _command_name(info: typer.models.CommandInfo) -> str:
+    """Return the CLI name typer gives a registered command."""
+    return info.name or info.callback.__name__.replace("_", "-")
+
+
+def run() -> None:
+    """Console-script entry point.
+
+    When argv names a known top-level command, only that command (plus sub-apps such as
+    roster) is handed to click, so the other commands' click objects are never built.
+    Anything else, including bare --help, dispatches the full app so help stays complete.
+    """
+    name = sys.argv[1] if len(sys.argv) > 1 and not sys.argv[1].startswith("-") else None
+    commands = [info for info in app.registered_commands if _command_name(info) == name]
+    if not commands:
+        app()
+        return
+    lean_app = copy.copy(app)
+    lean_app.registered_commands = commands
+    lean_app()
+
+
+def _stdout_is_tty() -> bool:
+    return sys.stdout.isatty()
+
+
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _tsv_escape(value: str) -> str:
+    return value.translate(_TSV_ESCAPES)
+
+
+def _emit(
+    title: str,
+    columns: list[tuple[str, dict[str, Any]]],
+    rows: list[tuple[str, ...]],
+    caption: str | None = None,
+) -> None:
+    """Print rows as a rich table on a terminal, or as tab-separated lines (header first) otherwise.
+
+    columns pairs each header with its rich add_column() options. In tab-separated output
+    the title is dropped, the caption (e.g. a truncation note) goes to stderr, and
+    backslashes, tabs and newlines in values are escaped so each row stays one line.
+    """
+    if not _stdout_is_tty():
+        sys.stdout.write("\t".join(name for name, _ in columns) + "\n")
+        sys.stdout.writelines("\t".join(_tsv_escape(value) for value in row) + "\n" for row in rows)
+        if caption:
+            sys.stderr.write(caption + "\n")
+        return
+
+    from rich import print
+    from rich.table import Table
+
+    table = Table(title=title, caption=caption)
+    for name, options in columns:
+        table.add_column(name, **options)
+    for row in rows:
+        table.add_row(*row)
+    print(table)
+
+
+def _emit_json(data: Any) -> None:
+    sys.stdout.write(json.dumps(data, indent=2) + "\n")
+
+
+@functools.cache
+def _default_store() -> FileManifestStore:
+    """Return the manifest store shared by every command in this process."""
+    from neurolab.storage.manifest_store import FileManifestStore
+
+    return FileManifestStore()
+
+
 def _resolve_manifest_id(
     id_or_alias: str,
     roster_store: RosterStore,
@@ -32,24 +112,44 @@ def _resolve_manifest_id(
 
 
 @app.command()
-def collect(path: str):
+def collect(
+    path: str,
+    prior: str | None = typer.Option(
+        None,
+        "--prior",
+        help="Manifest ID or roster alias to reuse content hashes from for unchanged files.",
+    ),
+):
     """Collect artifacts from a data source and save the resulting manifest."""
-    source = DataSourceSpec(uri=path)
-    manifest = collect_source(source)
+    from rich import print
 
-    table = Table(title="Collection Summary")
-    table.add_column("Metric", no_wrap=True)
-    table.add_column("Value", no_wrap=True)
+    from neurolab.data_interface.models import DataSourceSpec
+    from neurolab.data_interface.orchestrator import collect_source
 
-    table.add_row("Source", path)
-    table.add_row("Artifacts Found", str(len(manifest.artifacts)))
-    table.add_row("Warnings", str(len(manifest.warnings)))
+    manifest_store = _default_store()
+    prior_manifest = None
+    if prior is not None:
+        try:
+            prior_manifest = manifest_store.load(_resolve_manifest_id(prior, RosterStore()))
+        except FileNotFoundError:
+            print(f"[red]Manifest {prior} not found.[/red]")
+            raise typer.Exit(code=1) from None
+
+    source = DataSourceSpec(uri=path)
+    manifest = collect_source(source, prior=prior_manifest)
 
-    manifest_store = FileManifestStore()
     manifest_store.save(manifest)
-    table.add_row("Manifest ID", manifest.manifest_id)
 
-    print(table)
+    _emit(
+        "Collection Summary",
+        [("Metric", {"no_wrap": True}), ("Value", {"no_wrap": True})],
+        [
+            ("Source", path),
+            ("Artifacts Found", str(manifest.artifact_count)),
+            ("Warnings", str(manifest.warning_count)),
+            ("Manifest ID", manifest.manifest_id),
+        ],
+    )
 
 
 @app.command()
@@ -65,60 +165,45 @@ def history(
         "--all",
         help="Show all stored manifests.",
     ),
+    as_json: bool = typer.Option(False, "--json", help="Print manifests as JSON."),
 ):
     """
     List stored manifests (newest first).
     """
-    store = FileManifestStore()
-    manifest_ids = store.list()
+    from rich import print
 
-    if not manifest_ids:
+    store = _default_store()
+    # Headers come from the store's index, so no manifest needs to be parsed here
+    headers = list(store.iter_headers())
+
+    if not headers and not as_json:
         print("[yellow]No stored manifests found.[/yellow]")
         return
 
-    # Load manifests
-    manifests = []
-    for mid in manifest_ids:
-        try:
-            m = store.load(mid)
-            manifests.append(m)
-        except Exception:
-            continue
-
     # Sort newest first
-    manifests.sort(key=lambda m: m.created_at, reverse=True)
+    headers.sort(key=lambda h: h.created_at, reverse=True)
 
-    total = len(manifests)
+    total = len(headers)
 
     if not show_all:
-        manifests = manifests[:head]
-
-    table = Table(title="Stored Manifests - Created At, descending")
-    table.add_column("Created At", style="bold cyan")
-    table.add_column("Manifest ID", style="cyan", no_wrap=True)
-    table.add_column("Source", style="green")
-    table.add_column("Artifacts", justify="right")
-    table.add_column("Warnings", justify="right")
-
-    for m in manifests:
-        table.add_row(
-            m.created_at.isoformat(),
-            m.manifest_id,
-            m.source.uri,
-            str(len(m.artifacts)),
-            str(len(m.warnings)),
-        )
+        headers = headers[:head]
 
-    if not show_all and total > head:
-        table.add_row(
-            "...",
-            "...",
-            f"{total - head} other manifests",
-            "",
-            "",
-        )
+    if as_json:
+        _emit_json([h.to_dict() for h in headers])
+        return
 
-    print(table)
+    _emit(
+        "Stored Manifests - Created At, descending",
+        [
+            ("Created At", {"style": "bold cyan"}),
+            ("Manifest ID", {"style": "cyan", "no_wrap": True}),
+            ("Source", {"style": "green"}),
+            ("Artifacts", {"justify": "right"}),
+            ("Warnings", {"justify": "right"}),
+        ],
+        [(h.created_at.isoformat(), h.manifest_id, h.source_uri, str(h.artifact_count), str(h.warning_count)) for h in headers],
+        caption=f"... {total - head} other manifests" if not show_all and total > head else None,
+    )
 
 
 @app.command()
@@ -126,7 +211,9 @@ def delete(manifest_id: str):
     """
     Delete a stored manifest by ID (or roster alias, e.g. r1). Removes the alias from the roster if present.
     """
-    store = FileManifestStore()
+    from rich import print
+
+    store = _default_store()
     roster_store = RosterStore()
     resolved_id = _resolve_manifest_id(manifest_id, roster_store)
 
@@ -157,7 +244,9 @@ def clear():
     """
     Delete all stored manifests.
     """
-    store = FileManifestStore()
+    from rich import print
+
+    store = _default_store()
     manifest_ids = store.list()
 
     if not manifest_ids:
@@ -172,10 +261,9 @@ def clear():
         print("[yellow]Aborting clear operation.[/yellow]")
         return
 
-    for mid in manifest_ids:
-        store.delete(mid)
+    deleted = store.clear_all()
 
-    print(f"[green]Deleted {len(manifest_ids)} manifests.[/green]")
+    print(f"[green]Deleted {deleted} manifests.[/green]")
 
 
 @roster_app.command("add")
@@ -190,7 +278,9 @@ def roster_add(
     """
     Add a manifest to the roster by ID. Use the manifest in other commands by alias (e.g. diff r1 r2).
     """
-    manifest_store = FileManifestStore()
+    from rich import print
+
+    manifest_store = _default_store()
     roster_store = RosterStore()
     try:
         manifest_store.load(manifest_id)
@@ -207,8 +297,11 @@ def roster_list():
     """
     List roster entries (alias -> manifest ID). Optionally shows manifest details.
     """
+    from rich import print
+    from rich.table import Table
+
     roster_store = RosterStore()
-    manifest_store = FileManifestStore()
+    manifest_store = _default_store()
     entries = roster_store.load()
     if not entries:
         print("[yellow]Roster is empty.[/yellow]")
@@ -232,6 +325,8 @@ def roster_remove(alias: str):
     """
     Remove an alias from the roster.
     """
+    from rich import print
+
     roster_store = RosterStore()
     entries = roster_store.load()
     if alias not in entries:
@@ -246,6 +341,8 @@ def roster_clear():
     """
     Remove all entries from the roster.
     """
+    from rich import print
+
     roster_store = RosterStore()
     entries = roster_store.load()
     if not entries:
@@ -263,30 +360,40 @@ def roster_clear():
 
 
 @app.command()
-def info():
+def info(
+    as_json: bool = typer.Option(False, "--json", help="Print store info as JSON."),
+):
     """
     Show summary information about the manifest store.
     """
-    store = FileManifestStore()
-    manifest_ids = store.list()
+    from rich import print
+
+    store = _default_store()
+    created = [h.created_at for h in store.iter_headers()]
+
+    if as_json:
+        _emit_json(
+            {
+                "total_manifests": len(created),
+                "oldest": min(created).isoformat() if created else None,
+                "newest": max(created).isoformat() if created else None,
+            }
+        )
+        return
 
-    if not manifest_ids:
+    if not created:
         print("[yellow]No stored manifests found.[/yellow]")
         return
 
-    table = Table(title="Manifest Store Info")
-    table.add_column("Metric", style="bold cyan")
-    table.add_column("Value", style="bold green")
-
-    table.add_row("Total Manifests", str(len(manifest_ids)))
-
-    manifests = [store.load(mid) for mid in manifest_ids]
-    manifests.sort(key=lambda m: m.created_at)
-
-    table.add_row("Oldest Manifest", manifests[0].created_at.isoformat())
-    table.add_row("Newest Manifest", manifests[-1].created_at.isoformat())
-
-    print(table)
+    _emit(
+        "Manifest Store Info",
+        [("Metric", {"style": "bold cyan"}), ("Value", {"style": "bold green"})],
+        [
+            ("Total Manifests", str(len(created))),
+            ("Oldest Manifest", min(created).isoformat()),
+            ("Newest Manifest", max(created).isoformat()),
+        ],
+    )
 
 
 @app.command()
@@ -298,11 +405,14 @@ def diff(
         "--long",
         help="Show detailed file-level differences.",
     ),
+    as_json: bool = typer.Option(False, "--json", help="Print added, removed, and modified paths as JSON."),
 ):
     """
     Compare two manifests.
     """
-    store = FileManifestStore()
+    from rich import print
+
+    store = _default_store()
     roster_store = RosterStore()
     resolved_id1 = _resolve_manifest_id(id1, roster_store)
     resolved_id2 = _resolve_manifest_id(id2, roster_store)
@@ -314,44 +424,45 @@ def diff(
         print("[red]One or both manifest IDs not found.[/red]")
         raise typer.Exit(code=1) from None
 
-    # Index artifacts by relative_path
-    a1 = {a.relative_path: a for a in m1.artifacts if a.relative_path is not None}
-    a2 = {a.relative_path: a for a in m2.artifacts if a.relative_path is not None}
-
-    paths1 = set(a1.keys())
-    paths2 = set(a2.keys())
-
-    added = sorted(paths2 - paths1)
-    removed = sorted(paths1 - paths2)
+    # Index artifacts by relative_path, reading it once per artifact
+    rel_path = attrgetter("relative_path")
+    a1 = {p: a for a in m1.artifacts if (p := rel_path(a)) is not None}
+    a2 = {p: a for a in m2.artifacts if (p := rel_path(a)) is not None}
 
+    added = []
+    removed = []
     modified = []
 
-    for path in sorted(paths1 & paths2):
-        art1 = a1[path]
-        art2 = a2[path]
+    # One sort over the union; each path is classified in the same pass
+    for path in sorted(a1.keys() | a2.keys()):
+        art1 = a1.get(path)
+        art2 = a2.get(path)
 
+        if art1 is None:
+            added.append(path)
+        elif art2 is None:
+            removed.append(path)
         # Prefer hash comparison if available
         # Is content_hash always expected to be present for filesystem artifacts?
         # If not, this fallback is necessary.
-        if art1.content_hash and art2.content_hash:
+        elif art1.content_hash and art2.content_hash:
             if art1.content_hash != art2.content_hash:
                 modified.append(path)
-        else:
-            # Fallback comparison
-            if art1.size_bytes != art2.size_bytes or art1.mtime != art2.mtime:
-                modified.append(path)
+        # Fallback comparison
+        elif art1.size_bytes != art2.size_bytes or art1.mtime != art2.mtime:
+            modified.append(path)
+
+    if as_json:
+        _emit_json({"added": added, "removed": removed, "modified": modified})
+        return
 
     # Summary view
     if not long:
-        table = Table(title="Manifest Diff Summary")
-        table.add_column("Metric", style="bold cyan")
-        table.add_column("Count", justify="right")
-
-        table.add_row("Added", str(len(added)))
-        table.add_row("Removed", str(len(removed)))
-        table.add_row("Modified", str(len(modified)))
-
-        print(table)
+        _emit(
+            "Manifest Diff Summary",
+            [("Metric", {"style": "bold cyan"}), ("Count", {"justify": "right"})],
+            [("Added", str(len(added))), ("Removed", str(len(removed))), ("Modified", str(len(modified)))],
+        )
         return
 
     # Detailed view
@@ -359,28 +470,24 @@ def diff(
         print("[green]No differences detected between manifests.[/green]")
         return
 
-    table = Table(title="Manifest Diff (Detailed)")
-    table.add_column("Change Type", style="bold cyan")
-    table.add_column("Path", style="green")
-
-    for path in added:
-        table.add_row("Added", path)
-
-    for path in removed:
-        table.add_row("Removed", path)
-
-    for path in modified:
-        table.add_row("Modified", path)
-
-    print(table)
+    _emit(
+        "Manifest Diff (Detailed)",
+        [("Change Type", {"style": "bold cyan"}), ("Path", {"style": "green"})],
+        [("Added", path) for path in added] + [("Removed", path) for path in removed] + [("Modified", path) for path in modified],
+    )
 
 
 @app.command()
-def show(manifest_id: str):
+def show(
+    manifest_id: str,
+    as_json: bool = typer.Option(False, "--json", help="Print the summary as JSON."),
+):
     """
     Show summary information for a stored manifest.
     """
-    store = FileManifestStore()
+    from rich import print
+
+    store = _default_store()
     roster_store = RosterStore()
     resolved_id = _resolve_manifest_id(manifest_id, roster_store)
 
@@ -390,13 +497,25 @@ def show(manifest_id: str):
         print(f"[red]Manifest {manifest_id} not found.[/red]")
         raise typer.Exit(code=1) from err
 
-    table = Table(title=f"Manifest {resolved_id}")
-    table.add_column("Metric", style="bold cyan")
-    table.add_column("Value", style="bold green", no_wrap=True)
-
-    table.add_row("Source", manifest.source.uri)
-    table.add_row("Created At", manifest.created_at.isoformat())
-    table.add_row("Artifacts", str(len(manifest.artifacts)))
-    table.add_row("Warnings", str(len(manifest.warnings)))
+    if as_json:
+        _emit_json(
+            {
+                "manifest_id": manifest.manifest_id,
+                "source_uri": manifest.source.uri,
+                "created_at": manifest.created_at.isoformat(),
+                "artifact_count": manifest.artifact_count,
+                "warning_count": manifest.warning_count,
+            }
+        )
+        return
 
-    print(table)
+    _emit(
+        f"Manifest {resolved_id}",
+        [("Metric", {"style": "bold cyan"}), ("Value", {"style": "bold green", "no_wrap": True})],
+        [
+            ("Source", manifest.source.uri),
+            ("Created At", manifest.created_at.isoformat()),
+            ("Artifacts", str(manifest.artifact_count)),
+            ("Warnings", str(manifest.warning_count)),
+        ],
+    )
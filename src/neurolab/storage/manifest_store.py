@@ -1,11 +1,80 @@
 from __future__ import annotations
 
 import json
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Protocol
+from typing import Any, Protocol, TypeVar
 
 from neurolab.data_interface.models import Manifest
 
+# Resolved once at import; every default-constructed store shares it.
+_DEFAULT_BASE = Path.home() / ".neurolab" / "data" / "manifests"
+
+# Sidecar file of one ManifestHeader per line; ".jsonl" keeps it out of the "*.json" manifest listing.
+_INDEX_NAME = "index.jsonl"
+
+# Manifests are written here first and renamed into place; never matched by the "*.json" listing.
+_TMP_SUFFIX = ".json.tmp"
+
+# Below this many ids, loading serially beats starting a thread pool.
+_PARALLEL_LOAD_MIN = 4
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True, slots=True)
+class ManifestHeader:
+    """Summary of a stored manifest, enough for listings without loading its artifacts.
+
+    Attributes:
+        manifest_id: The manifest's ID.
+        created_at: UTC timestamp of manifest creation.
+        source_uri: URI of the source the manifest was collected from.
+        artifact_count: Number of artifacts in the manifest.
+        warning_count: Number of warnings in the manifest.
+    """
+
+    manifest_id: str
+    created_at: datetime
+    source_uri: str
+    artifact_count: int
+    warning_count: int
+
+    @classmethod
+    def from_manifest(cls, manifest: Manifest) -> ManifestHeader:
+        return cls(
+            manifest_id=manifest.manifest_id,
+            created_at=manifest.created_at,
+            source_uri=manifest.source.uri,
+            artifact_count=manifest.artifact_count,
+            warning_count=manifest.warning_count,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a dictionary."""
+        return {
+            "manifest_id": self.manifest_id,
+            "created_at": self.created_at.isoformat(),
+            "source_uri": self.source_uri,
+            "artifact_count": self.artifact_count,
+            "warning_count": self.warning_count,
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> ManifestHeader:
+        """Construct a ManifestHeader from to_dict() output; raises KeyError/ValueError if malformed."""
+        return cls(
+            manifest_id=d["manifest_id"],
+            created_at=datetime.fromisoformat(d["created_at"]),
+            source_uri=d["source_uri"],
+            artifact_count=int(d["artifact_count"]),
+            warning_count=int(d["warning_count"]),
+        )
+
 
 class ManifestStore(Protocol):
     """
@@ -33,17 +102,53 @@ class ManifestStore(Protocol):
 class FileManifestStore:
     """
     Stores manifests locally as JSON files under ~/.neurolab/data/manifests/.
+    A sidecar index.jsonl keeps a ManifestHeader per manifest so listings need not
+    parse every manifest; it is appended on save (rewritten when a stored ID is saved
+    again) and rewritten on delete.
     """
 
     def __init__(self, base_dir: Path | None = None) -> None:
-        """Initialize store; base_dir defaults to ~/.neurolab/data/manifests."""
-        self.base_dir = base_dir if base_dir is not None else Path.home() / ".neurolab" / "data" / "manifests"
-        self.base_dir.mkdir(parents=True, exist_ok=True)
+        """Initialize store; base_dir defaults to ~/.neurolab/data/manifests and is created on first save."""
+        self.base_dir = base_dir if base_dir is not None else _DEFAULT_BASE
 
     def _path(self, manifest_id: str) -> Path:
         """Return the filesystem path for a given manifest_id."""
         return self.base_dir / f"{manifest_id}.json"
 
+    def _index_path(self) -> Path:
+        return self.base_dir / _INDEX_NAME
+
+    def _append_headers(self, headers: list[ManifestHeader]) -> None:
+        with self._index_path().open("a", encoding="utf-8") as f:
+            f.writelines(json.dumps(h.to_dict()) + "\n" for h in headers)
+
+    def _write_index(self, headers: Iterable[ManifestHeader]) -> None:
+        self._index_path().write_text("".join(json.dumps(h.to_dict()) + "\n" for h in headers), encoding="utf-8")
+
+    def _index_headers(self, headers: list[ManifestHeader]) -> None:
+        """Add headers to the index, rewriting it if any ID is already indexed (e.g. a re-collected manifest)."""
+        indexed = self._read_index()
+        if any(h.manifest_id in indexed for h in headers):
+            indexed.update((h.manifest_id, h) for h in headers)
+            self._write_index(indexed.values())
+        else:
+            self._append_headers(headers)
+
+    def _read_index(self) -> dict[str, ManifestHeader]:
+        """Return manifest_id -> header from the index; later lines win, bad lines are skipped."""
+        headers: dict[str, ManifestHeader] = {}
+        try:
+            with self._index_path().open("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        header = ManifestHeader.from_dict(json.loads(line))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    headers[header.manifest_id] = header
+        except FileNotFoundError:
+            pass
+        return headers
+
     def _resolve_id(self, manifest_id: str) -> str:
         """Resolve a full or prefix manifest ID to the unique full ID.
 
@@ -62,25 +167,123 @@ class FileManifestStore:
 
     def save(self, manifest: Manifest) -> None:
         """Persist manifest as JSON; overwrites existing file for same manifest_id."""
-        path = self._path(manifest.manifest_id)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(manifest.to_dict(), f, indent=2)
+        self.save_many([manifest])
+
+    def save_many(self, manifests: list[Manifest]) -> None:
+        """Persist several manifests, syncing the store directory once at the end.
+
+        Each manifest is written to a temporary file, fsynced, and renamed over its final
+        path, so neither a killed process nor a power loss leaves a truncated manifest behind.
+        """
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        for manifest in manifests:
+            path = self._path(manifest.manifest_id)
+            tmp = path.with_suffix(_TMP_SUFFIX)
+            with tmp.open("wb") as f:
+                f.write(manifest.to_json_bytes())
+                f.flush()
+                # Data must be on disk before the rename is, or the rename can outlive it
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        self._index_headers([ManifestHeader.from_manifest(m) for m in manifests])
+        self._fsync_dir()
+
+    def _fsync_dir(self) -> None:
+        """Flush directory entries (the renames) to disk; a no-op where directories cannot be opened (Windows)."""
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(self.base_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
     def load(self, manifest_id: str) -> Manifest:
         """Load manifest by ID or unique prefix; raises FileNotFoundError if not found."""
         resolved = self._resolve_id(manifest_id)
-        path = self._path(resolved)
-
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        return Manifest.from_dict(data)
+        return Manifest.from_json_bytes(self._path(resolved).read_bytes())
 
     def list(self) -> list[str]:
         """Return manifest IDs for all stored manifests."""
         return [p.stem for p in self.base_dir.glob("*.json") if p.is_file()]
 
+    def load_many(self, manifest_ids: list[str]) -> list[Manifest]:
+        """Load several manifests, in order, reading them concurrently; raises like load()."""
+        return self._map(self.load, manifest_ids)
+
+    def _map(self, fn: Callable[[str], _T], manifest_ids: list[str]) -> list[_T]:
+        """Apply fn to each id on a thread pool (file reads release the GIL); serial for a few ids."""
+        if len(manifest_ids) < _PARALLEL_LOAD_MIN:
+            return [fn(mid) for mid in manifest_ids]
+        with ThreadPoolExecutor(max_workers=min(32, len(manifest_ids))) as ex:
+            return list(ex.map(fn, manifest_ids))
+
+    def _load_header(self, manifest_id: str) -> ManifestHeader | None:
+        try:
+            return ManifestHeader.from_manifest(self.load(manifest_id))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def iter_headers(self) -> Iterator[ManifestHeader]:
+        """Yield a header for every stored manifest, read from the index.
+
+        Manifests missing from the index (e.g. saved before it existed) are loaded once, concurrently,
+        and added to it when the store is writable; unreadable ones are skipped. Index entries without a manifest file are ignored.
+        """
+        indexed = self._read_index()
+        manifest_ids = self.list()
+        unindexed = [mid for mid in manifest_ids if mid not in indexed]
+        missing = [h for h in self._map(self._load_header, unindexed) if h is not None]
+        if missing:
+            try:
+                self._append_headers(missing)
+            except OSError:
+                pass  # read-only or shared store: serve the headers without caching them
+            indexed.update((h.manifest_id, h) for h in missing)
+        for mid in manifest_ids:
+            header = indexed.get(mid)
+            if header is not None:
+                yield header
+
     def delete(self, manifest_id: str) -> None:
         """Remove manifest file by ID or unique prefix; raises FileNotFoundError if not found."""
         resolved = self._resolve_id(manifest_id)
         self._path(resolved).unlink()
+        self._drop_from_index({resolved})
+
+    def delete_many(self, manifest_ids: list[str]) -> int:
+        """Remove manifests by full ID, skipping ones already gone; return how many were removed.
+
+        Unlike delete(), prefixes are not resolved. The header index is rewritten once.
+        """
+        base = os.fspath(self.base_dir)
+        removed: set[str] = set()
+        for mid in manifest_ids:
+            try:
+                os.unlink(f"{base}/{mid}.json")
+            except FileNotFoundError:
+                continue
+            removed.add(mid)
+        if removed:
+            self._drop_from_index(removed)
+        return len(removed)
+
+    def _drop_from_index(self, manifest_ids: set[str]) -> None:
+        index_path = self._index_path()
+        if index_path.exists():
+            self._write_index(h for mid, h in self._read_index().items() if mid not in manifest_ids)
+
+    def clear_all(self) -> int:
+        """Remove every stored manifest, the header index and leftover temp files in one scan; return manifests removed."""
+        count = 0
+        try:
+            with os.scandir(self.base_dir) as it:
+                for e in it:
+                    if e.name.endswith(".json"):
+                        os.unlink(e.path)
+                        count += 1
+                    elif e.name == _INDEX_NAME or e.name.endswith(_TMP_SUFFIX):
+                        os.unlink(e.path)
+        except FileNotFoundError:
+            pass
+        return count
@@ -3,21 +3,22 @@ from pathlib import Path
 import pytest
 
 
-@pytest.fixture
-def structured_test_dir(tmp_path):
+@pytest.fixture(scope="session")
+def structured_test_dir(tmp_path_factory):
     """
-    Create a reusable test file tree:
+    Create a reusable test file tree, built once per session (tests must only read it):
         root/
             foo.txt
             bar.bin
             sub/
                 baz.txt
     """
-    (tmp_path / "foo.txt").write_text("foo")
-    (tmp_path / "bar.bin").write_bytes(b"\x00\x01")
-    (tmp_path / "sub").mkdir()
-    (tmp_path / "sub" / "baz.txt").write_text("baz")
-    return tmp_path
+    root = tmp_path_factory.mktemp("structured")
+    (root / "foo.txt").write_text("foo")
+    (root / "bar.bin").write_bytes(b"\x00\x01")
+    (root / "sub").mkdir()
+    (root / "sub" / "baz.txt").write_text("baz")
+    return root
 
 
 @pytest.fixture(scope="session")
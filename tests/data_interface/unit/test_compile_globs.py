@@ -0,0 +1,95 @@
+"""
+Unit tests for the _compile_globs helper.
+Compiled patterns are right-anchored, '*' stays within one component, '**' matches
+any number of directories and absolute patterns must match the whole path.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from neurolab.data_interface.collectors import _compile_globs, _path_matcher, _split_literal_prefix
+
+pytestmark = [pytest.mark.data_interface]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("pattern", "path", "expected"),
+    [
+        ("*.txt", "/data/a/b.txt", True),
+        ("*.txt", "/data/a/b.txt.bak", False),
+        ("a/*.txt", "/data/a/b.txt", True),
+        ("data/*.txt", "/data/a/b.txt", False),
+        ("/data/*/b.txt", "/data/a/b.txt", True),
+        ("/a/*.txt", "/data/a/b.txt", False),
+        ("file?.csv", "/data/file1.csv", True),
+        ("[!x]*.csv", "/data/run.csv", True),
+        ("[!x]*.csv", "/data/xrun.csv", False),
+        ("**/raw/*.csv", "/data/s1/raw/a.csv", True),
+        ("**/raw/*.csv", "/data/s1/clean/a.csv", False),
+        ("data/**", "data/s1/a.csv", True),
+        ("./*.csv", "/data/a.csv", True),
+        ("./raw/*.csv", "/data/raw/a.csv", True),
+    ],
+)
+def test_pattern_matching(pattern, path, expected):
+    regex = _compile_globs((pattern,))
+    assert (regex.match(path) is not None) == expected
+
+
+@pytest.mark.unit
+def test_empty_patterns_return_none():
+    assert _compile_globs(()) is None
+
+
+@pytest.mark.unit
+def test_any_pattern_matches():
+    regex = _compile_globs(("*.csv", "*.json"))
+    assert regex.match("/d/a.csv")
+    assert regex.match("/d/a.json")
+    assert not regex.match("/d/a.txt")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("pattern", "rel", "expected"),
+    [
+        ("build/**", "a.csv", False),
+        ("data/**/*.csv", "raw/x.csv", False),
+        ("data/**/*.csv", "data/raw/x.csv", True),
+        ("*.csv", "raw/x.csv", True),
+    ],
+)
+def test_relative_patterns_ignore_root_parents(pattern, rel, expected):
+    """Relative patterns see only the root-relative path, never the root's parent directories."""
+    matcher = _path_matcher((pattern,))
+    assert matcher(rel, f"/tmp/rv/build/data/{rel}") == expected
+
+
+@pytest.mark.unit
+def test_absolute_patterns_match_absolute_path():
+    matcher = _path_matcher(("/tmp/rv/*/x.csv",))
+    assert matcher("x.csv", "/tmp/rv/data/x.csv")
+    assert not matcher("x.csv", "/tmp/other/data/x.csv")
+
+
+@pytest.mark.unit
+def test_compiled_patterns_are_cached():
+    """Identical pattern tuples return the same compiled regex object."""
+    assert _compile_globs(("*.csv", "raw/**")) is _compile_globs(("*.csv", "raw/**"))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("data/2024/**/*.parquet", ("data/2024", "**/*.parquet")),
+        ("/root/data/*.csv", ("/root/data", "*.csv")),
+        ("data/x.csv", ("data", "x.csv")),
+        ("**/*.csv", ("", "**/*.csv")),
+        ("*.csv", ("", "*.csv")),
+    ],
+)
+def test_split_literal_prefix(pattern, expected):
+    assert _split_literal_prefix(pattern) == expected
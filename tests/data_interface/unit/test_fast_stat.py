@@ -0,0 +1,52 @@
+"""
+Unit tests for the statx-based fast_stat helper.
+fast_stat must agree with os.stat wherever it returns a value.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import os
+import sys
+
+import pytest
+
+from neurolab.data_interface._statx import _Statx, fast_stat
+
+pytestmark = [pytest.mark.data_interface]
+
+
+@pytest.mark.unit
+def test_matches_os_stat(tmp_path):
+    """Size and mtime agree with os.stat when statx is available."""
+    f = tmp_path / "a.txt"
+    f.write_text("hello")
+    result = fast_stat(str(f))
+    if result is None:
+        pytest.skip("statx not available on this platform")
+
+    st = os.stat(f)
+    size_bytes, mtime = result
+    assert size_bytes == st.st_size == 5
+    assert mtime == pytest.approx(st.st_mtime, abs=1e-6)
+
+
+@pytest.mark.unit
+def test_missing_file_returns_none(tmp_path):
+    """A missing file yields None so the caller's stat raises the real error."""
+    assert fast_stat(str(tmp_path / "nope")) is None
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(sys.platform == "linux", reason="non-Linux fallback only")
+def test_non_linux_returns_none(tmp_path):
+    f = tmp_path / "a.txt"
+    f.write_text("hello")
+    assert fast_stat(str(f)) is None
+
+
+@pytest.mark.unit
+def test_statx_struct_matches_kernel_layout():
+    """The ctypes mirror is the kernel's 256-byte struct statx, with stx_mtime at 0x70."""
+    assert ctypes.sizeof(_Statx) == 256
+    assert _Statx.stx_mtime.offset == 0x70
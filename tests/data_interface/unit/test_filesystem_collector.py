@@ -1,5 +1,11 @@
+import hashlib
+import os
+import uuid
+from dataclasses import replace
+
 import pytest
 
+from neurolab.data_interface import collectors
 from neurolab.data_interface.collectors import FilesystemCollector
 from neurolab.data_interface.models import DataSourceSpec
 
@@ -15,11 +21,8 @@ def _hash_map(manifest):
 
 
 @pytest.mark.unit
-def test_deterministic_hashing(tmp_path):
-    file = tmp_path / "a.txt"
-    file.write_text("hello")
-
-    source = DataSourceSpec(uri=str(tmp_path))
+def test_deterministic_hashing(structured_test_dir):
+    source = DataSourceSpec(uri=str(structured_test_dir))
     collector = FilesystemCollector()
 
     m1 = collector.collect(source)
@@ -47,33 +50,26 @@ def test_hash_changes_when_file_modified(tmp_path):
 
 
 @pytest.mark.unit
-def test_recursive_logic(tmp_path):
-    sub = tmp_path / "sub"
-    sub.mkdir()
-    (sub / "nested.txt").write_text("data")
-
+def test_recursive_logic(structured_test_dir):
     collector = FilesystemCollector()
 
-    source_non_recursive = DataSourceSpec(uri=str(tmp_path), recursive=False)
+    source_non_recursive = DataSourceSpec(uri=str(structured_test_dir), recursive=False)
     m_non_recursive = collector.collect(source_non_recursive)
-    assert len(m_non_recursive.artifacts) == 0
+    assert {a.relative_path for a in m_non_recursive.artifacts} == {"foo.txt", "bar.bin"}
 
-    source_recursive = DataSourceSpec(uri=str(tmp_path), recursive=True)
+    source_recursive = DataSourceSpec(uri=str(structured_test_dir), recursive=True)
     m_recursive = collector.collect(source_recursive)
-    assert len(m_recursive.artifacts) == 1
+    assert len(m_recursive.artifacts) == 3
     paths = [a.relative_path for a in m_recursive.artifacts]
-    assert any(p is not None and p.endswith("nested.txt") for p in paths)
+    assert any(p is not None and p.endswith("baz.txt") for p in paths)
 
 
 @pytest.mark.unit
-def test_include_exclude(tmp_path):
-    (tmp_path / "a.txt").write_text("data")
-    (tmp_path / "b.log").write_text("data")
-
+def test_include_exclude(structured_test_dir):
     source = DataSourceSpec(
-        uri=str(tmp_path),
+        uri=str(structured_test_dir),
         include_globs=["*.txt"],
-        exclude_globs=["*.log"],
+        exclude_globs=["sub/*"],
     )
 
     collector = FilesystemCollector()
@@ -82,7 +78,7 @@ def test_include_exclude(tmp_path):
     paths = [a.relative_path for a in m.artifacts]
 
     assert len(paths) == 1
-    assert paths[0].endswith("a.txt")
+    assert paths[0].endswith("foo.txt")
 
 
 @pytest.mark.unit
@@ -112,3 +108,214 @@ def test_single_file_source(tmp_path):
     assert art.artifact_type == "file"
     assert art.absolute_path == str(single_file.resolve())
     assert art.content_hash is not None
+
+
+@pytest.mark.unit
+def test_nested_paths_are_relative_to_root(structured_test_dir):
+    """Nested files get a root-relative path and an absolute path under the root."""
+    source = DataSourceSpec(uri=str(structured_test_dir))
+    m = FilesystemCollector().collect(source)
+
+    by_rel = {a.relative_path: a for a in m.artifacts}
+    nested = os.path.join("sub", "baz.txt")
+    assert set(by_rel) == {"foo.txt", "bar.bin", nested}
+    assert by_rel[nested].absolute_path == str(structured_test_dir / "sub" / "baz.txt")
+
+
+@pytest.mark.unit
+def test_each_artifact_gets_its_own_hash(tmp_path):
+    """Parallel hashing assigns each digest to the artifact it was computed from."""
+    for i in range(20):
+        (tmp_path / f"f{i:02d}.txt").write_text(f"content {i}")
+
+    m = FilesystemCollector().collect(DataSourceSpec(uri=str(tmp_path)))
+
+    assert len(m.artifacts) == 20
+    for a in m.artifacts:
+        expected = hashlib.sha256((tmp_path / a.relative_path).read_bytes()).hexdigest()
+        assert a.content_hash == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("pattern", ["**/__pycache__", "__pycache__/", "__pycache__/**", "pkg/__pycache__"])
+def test_excluded_directory_is_pruned(tmp_path, pattern):
+    """Directory excludes drop the whole subtree, including nested files."""
+    (tmp_path / "pkg" / "__pycache__" / "deep").mkdir(parents=True)
+    (tmp_path / "pkg" / "__pycache__" / "mod.pyc").write_text("x")
+    (tmp_path / "pkg" / "__pycache__" / "deep" / "other.pyc").write_text("x")
+    (tmp_path / "pkg" / "mod.py").write_text("x")
+
+    m = FilesystemCollector().collect(DataSourceSpec(uri=str(tmp_path), exclude_globs=[pattern]))
+
+    assert [a.relative_path for a in m.artifacts] == [os.path.join("pkg", "mod.py")]
+
+
+@pytest.mark.unit
+def test_globs_do_not_match_root_parent_directories(tmp_path):
+    """A root under 'build/' or 'data/' is not excluded or included by that parent's name."""
+    root = tmp_path / "build" / "data" / "study"
+    (root / "raw").mkdir(parents=True)
+    (root / "raw" / "x.csv").write_text("x")
+
+    m = FilesystemCollector().collect(DataSourceSpec(uri=str(root), exclude_globs=["build/**"]))
+    assert [a.relative_path for a in m.artifacts] == [os.path.join("raw", "x.csv")]
+
+    m = FilesystemCollector().collect(DataSourceSpec(uri=str(root), include_globs=["data/**/*.csv"]))
+    assert m.artifacts == []
+
+
+@pytest.mark.unit
+def test_single_file_source_matches_multi_component_patterns(tmp_path, monkeypatch):
+    """A single-file source matches relative patterns against its whole path, not just its name."""
+    (tmp_path / "ds" / "data").mkdir(parents=True)
+    (tmp_path / "ds" / "data" / "x.csv").write_text("x")
+    monkeypatch.chdir(tmp_path)
+
+    m = FilesystemCollector().collect(DataSourceSpec(uri="ds/data/x.csv", include_globs=["data/*.csv"]))
+    assert len(m.artifacts) == 1
+
+    m = FilesystemCollector().collect(DataSourceSpec(uri="ds/data/x.csv", exclude_globs=["data/*"]))
+    assert m.artifacts == []
+
+
+@pytest.mark.unit
+def test_statx_is_opt_in(structured_test_dir, monkeypatch):
+    """statx is only used with hints["statx"]; both paths report the same metadata."""
+    calls = []
+
+    def _recording_fast_stat(path):
+        calls.append(path)
+        return None  # fall back to os.stat
+
+    monkeypatch.setattr(collectors, "fast_stat", _recording_fast_stat)
+    plain = FilesystemCollector().collect(DataSourceSpec(uri=str(structured_test_dir)))
+    assert calls == []
+
+    hinted = FilesystemCollector().collect(DataSourceSpec(uri=str(structured_test_dir), hints={"statx": True}))
+    assert len(calls) == 3
+    assert [(a.size_bytes, a.mtime) for a in hinted.artifacts] == [(a.size_bytes, a.mtime) for a in plain.artifacts]
+
+
+@pytest.mark.unit
+def test_wildcard_exclude_does_not_prune_directories(tmp_path):
+    """A wildcard file pattern like '*.log' never skips a directory that happens to match it."""
+    (tmp_path / "run.log").mkdir()
+    (tmp_path / "run.log" / "data.csv").write_text("x")
+
+    m = FilesystemCollector().collect(DataSourceSpec(uri=str(tmp_path), exclude_globs=["*.log"]))
+
+    assert [a.relative_path for a in m.artifacts] == [os.path.join("run.log", "data.csv")]
+
+
+@pytest.mark.unit
+def test_artifact_ids_are_unique_uuid4(structured_test_dir):
+    m = FilesystemCollector().collect(DataSourceSpec(uri=str(structured_test_dir)))
+
+    ids = [a.artifact_id for a in m.artifacts]
+    assert len(set(ids)) == len(ids) == 3
+    assert all(uuid.UUID(i).version == 4 for i in ids)
+
+
+@pytest.mark.unit
+def test_artifacts_sorted_by_relative_path(structured_test_dir):
+    m = FilesystemCollector().collect(DataSourceSpec(uri=str(structured_test_dir)))
+
+    paths = [a.relative_path for a in m.artifacts]
+    assert paths == sorted(paths)
+
+
+@pytest.mark.unit
+def test_prior_manifest_hashes_reused_for_unchanged_files(tmp_path):
+    """Files with the same path, size and mtime as in the prior manifest are not re-hashed."""
+    (tmp_path / "same.txt").write_text("same")
+    (tmp_path / "changed.txt").write_text("before")
+    collector = FilesystemCollector()
+    source = DataSourceSpec(uri=str(tmp_path))
+
+    first = collector.collect(source)
+    # Mark the prior hashes so reuse is observable
+    prior = replace(first, artifacts=[replace(a, content_hash="prior-" + a.relative_path) for a in first.artifacts])
+    (tmp_path / "changed.txt").write_text("after!!")
+
+    hashes = _hash_map(collector.collect(source, prior=prior))
+
+    assert hashes["same.txt"] == "prior-same.txt"
+    assert hashes["changed.txt"] == hashlib.sha256(b"after!!").hexdigest()
+
+
+@pytest.mark.unit
+def test_parallel_walk_matches_serial_walk(tmp_path):
+    """hints['parallel_walk'] changes how directories are listed, not what is collected."""
+    for d in ("a", "a/b", "a/b/c", "d"):
+        (tmp_path / d).mkdir()
+        for i in range(3):
+            (tmp_path / d / f"f{i}.txt").write_text(f"{d}-{i}")
+    collector = FilesystemCollector()
+
+    serial = collector.collect(DataSourceSpec(uri=str(tmp_path)))
+    parallel = collector.collect(DataSourceSpec(uri=str(tmp_path), hints={"parallel_walk": True}))
+
+    assert len(parallel.artifacts) == 12
+    assert _hash_map(parallel) == _hash_map(serial)
+    assert [a.relative_path for a in parallel.artifacts] == [a.relative_path for a in serial.artifacts]
+
+
+@pytest.mark.unit
+def test_absolute_include_prefix_limits_walk(tmp_path, monkeypatch):
+    """Absolute include patterns sharing a literal prefix only list directories under it."""
+    (tmp_path / "data" / "2024" / "jan").mkdir(parents=True)
+    (tmp_path / "data" / "2024" / "jan" / "a.parquet").write_text("x")
+    (tmp_path / "other").mkdir()
+    (tmp_path / "other" / "b.parquet").write_text("x")
+
+    scanned = []
+    real_scandir = os.scandir
+
+    def recording_scandir(path):
+        scanned.append(str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", recording_scandir)
+    pattern = f"{tmp_path.as_posix()}/data/2024/**/*.parquet"
+    m = FilesystemCollector().collect(DataSourceSpec(uri=str(tmp_path), include_globs=[pattern]))
+
+    assert [a.relative_path for a in m.artifacts] == [os.path.join("data", "2024", "jan", "a.parquet")]
+    assert str(tmp_path) not in scanned
+    assert str(tmp_path / "other") not in scanned
+
+
+@pytest.mark.unit
+def test_follow_symlinks_hint_resolves_absolute_paths(tmp_path):
+    """Symlinked files keep their link path unless hints['follow_symlinks'] is set."""
+    target_dir = tmp_path / "target"
+    target_dir.mkdir()
+    (target_dir / "real.txt").write_text("data")
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "link.txt").symlink_to(target_dir / "real.txt")
+    collector = FilesystemCollector()
+
+    plain = collector.collect(DataSourceSpec(uri=str(src)))
+    resolved = collector.collect(DataSourceSpec(uri=str(src), hints={"follow_symlinks": True}))
+
+    assert plain.artifacts[0].absolute_path == str(src / "link.txt")
+    assert resolved.artifacts[0].absolute_path == str((target_dir / "real.txt").resolve())
+    assert resolved.artifacts[0].relative_path == "link.txt"
+
+
+@pytest.mark.unit
+def test_warnings_are_capped(tmp_path, monkeypatch):
+    """Past the cap, warnings are counted and summarized instead of stored."""
+    for i in range(5):
+        (tmp_path / f"f{i}.txt").write_text("x")
+    monkeypatch.setattr(collectors, "_MAX_WARNINGS", 2)
+
+    def failing_hash(path):
+        raise OSError("boom")
+
+    monkeypatch.setattr(collectors, "hash_file_sha256", failing_hash)
+    m = FilesystemCollector().collect(DataSourceSpec(uri=str(tmp_path)))
+
+    assert len(m.warnings) == 3
+    assert all(w.startswith("hash failed for") for w in m.warnings[:2])
+    assert m.warnings[2] == "... and 3 more warnings suppressed"
@@ -9,6 +9,7 @@ import hashlib
 
 import pytest
 
+from neurolab.data_interface import hashing
 from neurolab.data_interface.hashing import hash_file_sha256
 
 pytestmark = [pytest.mark.data_interface]
@@ -51,3 +52,40 @@ def test_empty_file(tmp_path):
     f.write_bytes(b"")
     expected = hashlib.sha256(b"").hexdigest()
     assert hash_file_sha256(f) == expected
+
+
+@pytest.mark.unit
+def test_large_file_matches_expected(tmp_path):
+    """Files spanning many chunks hash the same as hashing the bytes directly."""
+    data = bytes(range(256)) * (5 * 4096 + 3)  # a little over 5 MiB
+    f = tmp_path / "large.bin"
+    f.write_bytes(data)
+    assert hash_file_sha256(f) == hashlib.sha256(data).hexdigest()
+
+
+@pytest.mark.unit
+def test_file_truncated_while_hashing(tmp_path, monkeypatch):
+    """A file that shrinks mid-hash yields the hash of what was read instead of crashing."""
+    chunk = 64 * 1024
+    data = bytes(range(256)) * (3 * chunk // 256)
+    f = tmp_path / "rotating.log"
+    f.write_bytes(data)
+
+    real_sha256 = hashlib.sha256
+
+    class TruncatingHash:
+        """Truncates the file after the first chunk has been hashed."""
+
+        def __init__(self):
+            self._h = real_sha256()
+
+        def update(self, b):
+            self._h.update(b)
+            if f.stat().st_size:
+                f.write_bytes(b"")
+
+        def hexdigest(self):
+            return self._h.hexdigest()
+
+    monkeypatch.setattr(hashing.hashlib, "sha256", TruncatingHash)
+    assert hash_file_sha256(f, chunk_size=chunk) == real_sha256(data[:chunk]).hexdigest()
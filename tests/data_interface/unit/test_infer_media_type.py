@@ -4,8 +4,6 @@ Unit tests for _infer_media_type helper.
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 
 from neurolab.data_interface.collectors import _infer_media_type
@@ -33,15 +31,29 @@ pytestmark = [pytest.mark.data_interface]
     ],
 )
 def test_known_extensions(filename, expected):
-    assert _infer_media_type(Path(filename)) == expected
+    assert _infer_media_type(filename) == expected
 
 
 @pytest.mark.unit
 def test_unknown_extension_returns_none():
-    assert _infer_media_type(Path("image.bmp")) is None
+    assert _infer_media_type("image.bmp") is None
 
 
 @pytest.mark.unit
 def test_case_insensitive():
-    assert _infer_media_type(Path("DATA.CSV")) == "text/csv"
-    assert _infer_media_type(Path("Config.JSON")) == "application/json"
+    assert _infer_media_type("DATA.CSV") == "text/csv"
+    assert _infer_media_type("Config.JSON") == "application/json"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("backup.tar.gz", "application/gzip"),
+        (".csv", None),
+        ("noext", None),
+    ],
+)
+def test_extension_is_last_suffix_of_name(filename, expected):
+    """Only the last suffix counts, and a leading dot does not start one."""
+    assert _infer_media_type(filename) == expected
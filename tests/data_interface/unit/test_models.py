@@ -5,10 +5,12 @@ Covers round-trip serialization (to_dict/from_dict) and validation (TypeError/Va
 
 from __future__ import annotations
 
+import json
 from datetime import UTC, datetime
 
 import pytest
 
+from neurolab.data_interface import models
 from neurolab.data_interface.models import (
     Artifact,
     DataSourceSpec,
@@ -266,6 +268,19 @@ def test_manifest_artifact_count():
     assert manifest2.artifact_count == 2
 
 
+@pytest.mark.unit
+def test_manifest_warning_count():
+    """Manifest.warning_count returns len(warnings)."""
+    manifest = Manifest(
+        manifest_id="m1",
+        source=DataSourceSpec(uri="/data"),
+        created_at=datetime.now(UTC),
+        artifacts=[],
+        warnings=["w1", "w2"],
+    )
+    assert manifest.warning_count == 2
+
+
 @pytest.mark.unit
 def test_manifest_from_dict_not_dict_raises():
     """Manifest.from_dict raises TypeError when input is not a dict."""
@@ -299,3 +314,60 @@ def test_manifest_from_dict_naive_created_at_raises():
     }
     with pytest.raises(ValueError, match="created_at must be timezone-aware"):
         Manifest.from_dict(d)
+
+
+@pytest.mark.unit
+def test_manifest_to_json_bytes_matches_to_dict():
+    """Manifest.to_json_bytes encodes the same document as to_dict."""
+    art = Artifact(
+        artifact_id="a1",
+        source_uri="file:///data",
+        artifact_type="file",
+        relative_path="x.csv",
+        absolute_path="/data/x.csv",
+        size_bytes=10,
+        mtime=datetime(2024, 1, 1, 0, 0, 0, 123456, tzinfo=UTC),
+        content_hash="h1",
+        media_type="text/csv",
+        tags={"k": "v"},
+    )
+    manifest = Manifest(
+        manifest_id="mid-1",
+        source=DataSourceSpec(uri="/data", include_globs=["*.csv"]),
+        created_at=datetime(2024, 2, 1, 0, 0, 0, tzinfo=UTC),
+        artifacts=[art],
+        warnings=["w1"],
+    )
+    assert json.loads(manifest.to_json_bytes()) == manifest.to_dict()
+    assert Manifest.from_json_bytes(manifest.to_json_bytes()) == manifest
+
+
+@pytest.mark.unit
+def test_manifest_json_bytes_roundtrip_without_orjson(monkeypatch):
+    """to_json_bytes/from_json_bytes fall back to the stdlib json module when orjson is absent."""
+    monkeypatch.setattr(models, "orjson", None)
+    manifest = Manifest(
+        manifest_id="mid-1",
+        source=DataSourceSpec(uri="/data"),
+        created_at=datetime(2024, 2, 1, 0, 0, 0, tzinfo=UTC),
+        artifacts=[],
+    )
+    assert Manifest.from_json_bytes(manifest.to_json_bytes()) == manifest
+
+
+@pytest.mark.unit
+def test_artifact_unsafe_construct_matches_init():
+    """Artifact._unsafe_construct yields an artifact equal to one built via __init__."""
+    kwargs = {
+        "source_uri": "file:///data",
+        "artifact_type": "file",
+        "relative_path": "x.csv",
+        "absolute_path": "/data/x.csv",
+        "size_bytes": 10,
+        "mtime": datetime(2024, 1, 1, 0, 0, 0, tzinfo=UTC),
+        "content_hash": "h1",
+        "media_type": "text/csv",
+        "artifact_id": "a1",
+        "tags": {},
+    }
+    assert Artifact._unsafe_construct(tuple(kwargs.values())) == Artifact(**kwargs)
@@ -5,10 +5,15 @@ Covers collect, history, show, info, diff, delete, and clear.
 
 from __future__ import annotations
 
+import json
+import subprocess
+import sys
+
 import pytest
 from typer.testing import CliRunner
 
-from neurolab.interfaces.cli import app
+from neurolab.interfaces import cli
+from neurolab.interfaces.cli import _default_store, app, run
 from neurolab.storage.manifest_store import FileManifestStore
 from neurolab.storage.roster_store import RosterStore
 
@@ -25,7 +30,6 @@ def cli_env(tmp_path, monkeypatch):
 
     def _patched_manifest_store_init(self, base_dir=None):
         self.base_dir = manifest_dir
-        self.base_dir.mkdir(parents=True, exist_ok=True)
 
     def _patched_roster_store_init(self, path=None):
         self.path = roster_path
@@ -34,7 +38,16 @@ def cli_env(tmp_path, monkeypatch):
     monkeypatch.setattr(FileManifestStore, "__init__", _patched_manifest_store_init)
     monkeypatch.setattr(RosterStore, "__init__", _patched_roster_store_init)
 
-    return tmp_path
+    # Commands share a cached store; drop it so each test gets one built with the patched __init__
+    _default_store.cache_clear()
+    yield tmp_path
+    _default_store.cache_clear()
+
+
+@pytest.fixture()
+def tty(monkeypatch):
+    """Render rich tables as if stdout were a terminal (CliRunner output is not a TTY)."""
+    monkeypatch.setattr(cli, "_stdout_is_tty", lambda: True)
 
 
 @pytest.fixture()
@@ -51,7 +64,7 @@ def sample_source(tmp_path):
 
 
 @pytest.mark.unit
-def test_collect_success(cli_env, sample_source):
+def test_collect_success(cli_env, tty, sample_source):
     result = runner.invoke(app, ["collect", str(sample_source)])
     assert result.exit_code == 0
     assert "Collection Summary" in result.output
@@ -65,6 +78,22 @@ def test_collect_nonexistent_path(cli_env, tmp_path):
     assert "0" in result.output  # 0 artifacts
 
 
+@pytest.mark.unit
+def test_collect_with_prior(cli_env, tty, sample_source):
+    runner.invoke(app, ["collect", str(sample_source)])
+    mid = FileManifestStore().list()[0]
+    result = runner.invoke(app, ["collect", str(sample_source), "--prior", mid])
+    assert result.exit_code == 0
+    assert "Collection Summary" in result.output
+
+
+@pytest.mark.unit
+def test_collect_with_missing_prior(cli_env, sample_source):
+    result = runner.invoke(app, ["collect", str(sample_source), "--prior", "nope"])
+    assert result.exit_code == 1
+    assert "not found" in result.output
+
+
 # --- history ---
 
 
@@ -76,13 +105,65 @@ def test_history_empty(cli_env):
 
 
 @pytest.mark.unit
-def test_history_after_collect(cli_env, sample_source):
+def test_history_after_collect(cli_env, tty, sample_source):
     runner.invoke(app, ["collect", str(sample_source)])
     result = runner.invoke(app, ["history"])
     assert result.exit_code == 0
     assert "Stored Manifests" in result.output
 
 
+@pytest.mark.unit
+def test_history_head_limits_rows(cli_env, tty, sample_source, tmp_path):
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "c.txt").write_text("different")
+    runner.invoke(app, ["collect", str(sample_source)])
+    runner.invoke(app, ["collect", str(other)])
+    result = runner.invoke(app, ["history", "--head", "1"], env={"COLUMNS": "250"})
+    assert result.exit_code == 0
+    assert "1 other manifests" in result.output
+
+
+@pytest.mark.unit
+def test_history_piped_output_is_tsv(cli_env, sample_source):
+    runner.invoke(app, ["collect", str(sample_source)])
+    header = next(FileManifestStore().iter_headers())
+    result = runner.invoke(app, ["history"])
+    assert result.exit_code == 0
+    assert result.output.splitlines() == [
+        "Created At\tManifest ID\tSource\tArtifacts\tWarnings",
+        f"{header.created_at.isoformat()}\t{header.manifest_id}\t{sample_source}\t2\t0",
+    ]
+
+
+@pytest.mark.unit
+def test_history_piped_truncation_note_goes_to_stderr(cli_env, sample_source, tmp_path):
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "c.txt").write_text("different")
+    runner.invoke(app, ["collect", str(sample_source)])
+    runner.invoke(app, ["collect", str(other)])
+    result = runner.invoke(app, ["history", "--head", "1"])
+    assert result.exit_code == 0
+    assert len(result.stdout.splitlines()) == 2  # header + one manifest
+    assert "1 other manifests" in result.stderr
+
+
+@pytest.mark.unit
+def test_emit_escapes_tsv_values(capsys):
+    cli._emit("t", [("Path", {}), ("Note", {})], [("a\tb.csv", "line1\nline2\\x")])
+    assert capsys.readouterr().out.splitlines() == ["Path\tNote", "a\\tb.csv\tline1\\nline2\\\\x"]
+
+
+@pytest.mark.unit
+def test_history_json(cli_env, sample_source):
+    assert json.loads(runner.invoke(app, ["history", "--json"]).output) == []
+    runner.invoke(app, ["collect", str(sample_source)])
+    result = runner.invoke(app, ["history", "--json"])
+    assert result.exit_code == 0
+    assert json.loads(result.output) == [h.to_dict() for h in FileManifestStore().iter_headers()]
+
+
 # --- info ---
 
 
@@ -94,7 +175,7 @@ def test_info_empty(cli_env):
 
 
 @pytest.mark.unit
-def test_info_after_collect(cli_env, sample_source):
+def test_info_after_collect(cli_env, tty, sample_source):
     runner.invoke(app, ["collect", str(sample_source)])
     result = runner.invoke(app, ["info"])
     assert result.exit_code == 0
@@ -102,6 +183,35 @@ def test_info_after_collect(cli_env, sample_source):
     assert "1" in result.output  # 1 manifest
 
 
+@pytest.mark.unit
+def test_info_reads_headers_without_loading_manifests(cli_env, sample_source, tmp_path, monkeypatch):
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "c.txt").write_text("different")
+    runner.invoke(app, ["collect", str(sample_source)])
+    runner.invoke(app, ["collect", str(other)])
+    created = sorted(h.created_at for h in FileManifestStore().iter_headers())
+
+    def _fail_load(self, manifest_id):
+        raise AssertionError("info should not load manifests")
+
+    monkeypatch.setattr(FileManifestStore, "load", _fail_load)
+    result = runner.invoke(app, ["info"], env={"COLUMNS": "250"})
+    assert result.exit_code == 0
+    assert created[0].isoformat() in result.output
+    assert created[-1].isoformat() in result.output
+
+
+@pytest.mark.unit
+def test_info_json(cli_env, sample_source):
+    result = runner.invoke(app, ["info", "--json"])
+    assert json.loads(result.output) == {"total_manifests": 0, "oldest": None, "newest": None}
+    runner.invoke(app, ["collect", str(sample_source)])
+    result = runner.invoke(app, ["info", "--json"])
+    assert result.exit_code == 0
+    assert json.loads(result.output)["total_manifests"] == 1
+
+
 # --- show ---
 
 
@@ -113,7 +223,7 @@ def test_show_missing(cli_env):
 
 
 @pytest.mark.unit
-def test_show_after_collect(cli_env, sample_source):
+def test_show_after_collect(cli_env, tty, sample_source):
     runner.invoke(app, ["collect", str(sample_source)])
     store = FileManifestStore()
     mid = store.list()[0]
@@ -122,6 +232,18 @@ def test_show_after_collect(cli_env, sample_source):
     assert mid in result.output
 
 
+@pytest.mark.unit
+def test_show_json(cli_env, sample_source):
+    runner.invoke(app, ["collect", str(sample_source)])
+    mid = FileManifestStore().list()[0]
+    result = runner.invoke(app, ["show", mid, "--json"])
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["manifest_id"] == mid
+    assert data["source_uri"] == str(sample_source)
+    assert data["artifact_count"] == 2
+
+
 # --- diff ---
 
 
@@ -142,6 +264,25 @@ def test_diff_identical(cli_env, sample_source):
     assert "0" in result.output  # 0 added/removed/modified
 
 
+@pytest.mark.unit
+def test_diff_long_classifies_changes(cli_env, sample_source):
+    runner.invoke(app, ["collect", str(sample_source)])
+    first = FileManifestStore().list()[0]
+    (sample_source / "a.txt").write_text("changed")
+    (sample_source / "b.csv").unlink()
+    (sample_source / "c.txt").write_text("new")
+    runner.invoke(app, ["collect", str(sample_source)])
+    second = next(mid for mid in FileManifestStore().list() if mid != first)
+
+    result = runner.invoke(app, ["diff", first, second, "--long"])
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ["Change Type\tPath", "Added\tc.txt", "Removed\tb.csv", "Modified\ta.txt"]
+
+    result = runner.invoke(app, ["diff", first, second, "--json"])
+    assert result.exit_code == 0
+    assert json.loads(result.output) == {"added": ["c.txt"], "removed": ["b.csv"], "modified": ["a.txt"]}
+
+
 # --- delete ---
 
 
@@ -186,3 +327,30 @@ def test_clear_with_confirm(cli_env, sample_source):
     assert result.exit_code == 0
     assert "Deleted" in result.output
     assert store.list() == []
+
+
+# --- startup ---
+
+
+@pytest.mark.unit
+def test_cli_import_defers_command_dependencies():
+    """Importing the CLI loads no command implementation dependencies; each command imports its own."""
+    code = (
+        "import sys, neurolab.interfaces.cli; "
+        "heavy = ['rich', 'neurolab.data_interface.orchestrator', 'neurolab.storage.manifest_store']; "
+        "print([m for m in heavy if m in sys.modules])"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.unit
+def test_run_dispatches_named_command_only(cli_env, monkeypatch, capsys):
+    """run() dispatches the named command without mutating the shared app."""
+    registered = list(app.registered_commands)
+    monkeypatch.setattr(sys, "argv", ["neurolab", "info"])
+    with pytest.raises(SystemExit) as exc:
+        run()
+    assert exc.value.code == 0
+    assert "No stored manifests found" in capsys.readouterr().out
+    assert app.registered_commands == registered
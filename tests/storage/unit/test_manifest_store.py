@@ -96,6 +96,92 @@ def test_delete_missing_raises(tmp_path):
         store.delete("nonexistent-id")
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("count", [2, 6])
+def test_load_many_preserves_order(tmp_path, count):
+    """load_many() returns manifests in the requested order, serially or on the thread pool."""
+    store = FileManifestStore(base_dir=tmp_path)
+    ids = [f"id-{i}" for i in range(count)]
+    for mid in ids:
+        store.save(_sample_manifest(manifest_id=mid))
+
+    assert [m.manifest_id for m in store.load_many(ids[::-1])] == ids[::-1]
+
+
+@pytest.mark.unit
+def test_load_many_missing_raises(tmp_path):
+    """load_many() raises FileNotFoundError like load() when an id does not exist."""
+    store = FileManifestStore(base_dir=tmp_path)
+    store.save(_sample_manifest(manifest_id="id-1"))
+    with pytest.raises(FileNotFoundError, match="Manifest .* not found"):
+        store.load_many(["id-1", "nonexistent-id"])
+
+
+@pytest.mark.unit
+def test_read_only_operations_do_not_create_base_dir(tmp_path):
+    """The store directory is created by the first save, not by construction or reads."""
+    base_dir = tmp_path / "manifests"
+    store = FileManifestStore(base_dir=base_dir)
+
+    assert store.list() == []
+    assert list(store.iter_headers()) == []
+    assert store.clear_all() == 0
+    with pytest.raises(FileNotFoundError, match="Manifest .* not found"):
+        store.load("nonexistent-id")
+    assert not base_dir.exists()
+
+    store.save(_sample_manifest(manifest_id="id-1"))
+    assert store.list() == ["id-1"]
+
+
+@pytest.mark.unit
+def test_save_many_persists_all_without_temp_files(tmp_path):
+    """save_many() writes every manifest and indexes it, leaving no temporary files behind."""
+    store = FileManifestStore(base_dir=tmp_path)
+    store.save_many([_sample_manifest(manifest_id="id-1"), _sample_manifest(manifest_id="id-2")])
+
+    assert sorted(store.list()) == ["id-1", "id-2"]
+    assert sorted(h.manifest_id for h in store.iter_headers()) == ["id-1", "id-2"]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.unit
+def test_iter_headers_skips_unreadable_manifest(tmp_path):
+    """A truncated manifest file that is not in the index is skipped rather than raising."""
+    store = FileManifestStore(base_dir=tmp_path)
+    store.save(_sample_manifest(manifest_id="id-1"))
+    (tmp_path / "broken.json").write_text('{"manifest_id": "broken", "sou')
+
+    assert [h.manifest_id for h in store.iter_headers()] == ["id-1"]
+
+
+@pytest.mark.unit
+def test_delete_many_removes_listed_manifests(tmp_path):
+    """delete_many() removes the given ids from disk and the index, ignoring ids that are not stored."""
+    store = FileManifestStore(base_dir=tmp_path)
+    for mid in ("id-1", "id-2", "id-3"):
+        store.save(_sample_manifest(manifest_id=mid))
+
+    assert store.delete_many(["id-1", "id-3", "nonexistent-id"]) == 2
+    assert store.list() == ["id-2"]
+    assert [h.manifest_id for h in store.iter_headers()] == ["id-2"]
+    assert "id-1" not in (tmp_path / "index.jsonl").read_text()
+
+
+@pytest.mark.unit
+def test_clear_all_removes_manifests_and_index(tmp_path):
+    """clear_all() deletes every manifest and the header index, returning the manifest count."""
+    store = FileManifestStore(base_dir=tmp_path)
+    store.save(_sample_manifest(manifest_id="id-1"))
+    store.save(_sample_manifest(manifest_id="id-2"))
+    (tmp_path / "notes.txt").write_text("keep")
+
+    assert store.clear_all() == 2
+    assert store.list() == []
+    assert list(store.iter_headers()) == []
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["notes.txt"]
+
+
 @pytest.mark.unit
 def test_save_overwrites_existing(tmp_path):
     """Saving a manifest with same manifest_id overwrites the previous file."""
@@ -115,3 +201,69 @@ def test_save_overwrites_existing(tmp_path):
     loaded = store.load("overwrite")
     assert len(loaded.artifacts) == 0
     assert loaded.warnings == ["updated"]
+
+
+@pytest.mark.unit
+def test_iter_headers_reflects_saves_and_deletes(tmp_path):
+    """iter_headers() summarizes stored manifests from the index, tracking save and delete."""
+    store = FileManifestStore(base_dir=tmp_path)
+    store.save(_sample_manifest(manifest_id="id-1"))
+    store.save(_sample_manifest(manifest_id="id-2"))
+
+    headers = {h.manifest_id: h for h in store.iter_headers()}
+    assert set(headers) == {"id-1", "id-2"}
+    assert headers["id-1"].source_uri == "/data"
+    assert headers["id-1"].artifact_count == 1
+    assert headers["id-1"].warning_count == 0
+    assert headers["id-1"].created_at == datetime(2024, 2, 1, 0, 0, 0, tzinfo=UTC)
+
+    store.delete("id-1")
+    assert [h.manifest_id for h in store.iter_headers()] == ["id-2"]
+    assert "id-1" not in (tmp_path / "index.jsonl").read_text()
+
+
+@pytest.mark.unit
+def test_resaving_a_manifest_replaces_its_index_entry(tmp_path):
+    """Saving an already-indexed manifest ID again leaves one, updated, index line."""
+    store = FileManifestStore(base_dir=tmp_path)
+    store.save(_sample_manifest(manifest_id="id-1"))
+    store.save(_sample_manifest(manifest_id="id-2"))
+    updated = _sample_manifest(manifest_id="id-1")
+    updated = Manifest(
+        manifest_id=updated.manifest_id,
+        source=updated.source,
+        created_at=datetime(2024, 3, 1, 0, 0, 0, tzinfo=UTC),
+        artifacts=updated.artifacts,
+    )
+    store.save(updated)
+
+    lines = (tmp_path / "index.jsonl").read_text().splitlines()
+    assert len(lines) == 2
+    headers = {h.manifest_id: h for h in store.iter_headers()}
+    assert headers["id-1"].created_at == datetime(2024, 3, 1, 0, 0, 0, tzinfo=UTC)
+
+
+@pytest.mark.unit
+def test_iter_headers_backfills_unindexed_manifests(tmp_path):
+    """Manifests missing from the index are loaded once and added to it."""
+    store = FileManifestStore(base_dir=tmp_path)
+    store.save(_sample_manifest(manifest_id="id-1"))
+    (tmp_path / "index.jsonl").unlink()
+
+    assert [h.manifest_id for h in store.iter_headers()] == ["id-1"]
+    assert "id-1" in (tmp_path / "index.jsonl").read_text()
+
+
+@pytest.mark.unit
+def test_iter_headers_on_read_only_store(tmp_path, monkeypatch):
+    """An index that cannot be written does not stop headers from being listed."""
+    store = FileManifestStore(base_dir=tmp_path)
+    store.save(_sample_manifest(manifest_id="id-1"))
+    (tmp_path / "index.jsonl").unlink()
+
+    def _read_only(headers):
+        raise PermissionError("read-only store")
+
+    monkeypatch.setattr(store, "_append_headers", _read_only)
+    assert [h.manifest_id for h in store.iter_headers()] == ["id-1"]
+    assert not (tmp_path / "index.jsonl").exists()